@@ -367,19 +367,32 @@ class Component(abc.ABC, metaclass=ComponentMeta):
         """
         Iterate over all components in the component tree, with this component as the root.
         """
-        from . import fundamental_component  # Avoid circular import problem
-
         if include_root:
             yield self
 
-        if isinstance(self, fundamental_component.FundamentalComponent):
-            for child in self._iter_direct_children():
-                yield from child._iter_component_tree()
-        else:
-            build_result = self.session._weak_component_data_by_component[
-                self
-            ].build_result
-            yield from build_result._iter_component_tree()
+        # Walk the tree with an explicit stack rather than recursive
+        # generators, which get slow for deeply nested trees. Children are
+        # pushed in reverse so they're yielded in pre-order.
+        to_do = list(self._iter_tree_children())
+        to_do.reverse()
+
+        while to_do:
+            component = to_do.pop()
+            yield component
+
+            children = list(component._iter_tree_children())
+            children.reverse()
+            to_do += children
+
+    def _iter_tree_children(self) -> Iterable[Component]:
+        """
+        Return the components directly below this one in the component tree.
+        For high-level components that's their build result. Fundamental
+        components override this to return their children instead.
+        """
+        return (
+            self.session._weak_component_data_by_component[self].build_result,
+        )
 
     async def _on_message(self, msg: Jsonable, /) -> None:
         raise RuntimeError(
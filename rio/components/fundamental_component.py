@@ -77,6 +77,11 @@ class FundamentalComponent(Component):
             f"Attempted to call `build` on `FundamentalComponent` {self}"
         )
 
+    def _iter_tree_children(self) -> Iterable[Component]:
+        # Fundamental components aren't built. Their children are stored
+        # directly in their attributes.
+        return self._iter_direct_children()
+
     @classmethod
     def build_javascript_source(cls, sess: rio.Session) -> str:
         """
@@ -77,10 +77,15 @@ class Text(FundamentalComponent):
     def _custom_serialize(self) -> JsonDoc:
         # Serialization doesn't handle unions. Hence the custom serialization
         # here
-        if isinstance(self.style, str):
-            style = self.style
-        else:
-            style = self.style._serialize(self.session)
+        #
+        # Accessing state properties is pretty slow and this runs for every
+        # single `Text` on each refresh, so read the style only once.
+        style = self.style
+
+        # `type(...) is` is cheaper than `isinstance`, but type checkers don't
+        # narrow unions based on it
+        if type(style) is not str:
+            style = style._serialize(self.session)  # type: ignore
 
         return {
             "style": style,
@@ -93,7 +98,8 @@ class Text(FundamentalComponent):
         else:
             text = self.text
 
-        return f"<{type(self).__name__} id:{self._id} text:{text!r}>"
+        # `Text` is final, so there's no need to look up the class name
+        return f"<Text id:{self._id} text:{text!r}>"
 
 
 Text._unique_id = "Text-builtin"
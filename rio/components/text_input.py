@@ -18,7 +18,7 @@ __all__ = [
 
 @final
 @rio.docs.mark_constructor_as_private
-@dataclass
+@dataclass(slots=True)
 class TextInputChangeEvent:
     """
     Holds information regarding a text input change event.
@@ -37,7 +37,7 @@ class TextInputChangeEvent:
 
 @final
 @rio.docs.mark_constructor_as_private
-@dataclass
+@dataclass(slots=True)
 class TextInputConfirmEvent:
     """
     Holds information regarding a text input confirm event.
@@ -149,16 +149,38 @@ class TextInput(KeyboardFocusableFundamentalComponent):
     on_change: rio.EventHandler[TextInputChangeEvent] = None
     on_confirm: rio.EventHandler[TextInputConfirmEvent] = None
 
+    # Whether the most recently applied delta state from the frontend actually
+    # changed the text. The frontend may send the text even if it hasn't
+    # changed, which isn't worth an `on_change` event.
+    _text_changed_by_frontend = False
+
     def _validate_delta_state_from_frontend(self, delta_state: JsonDoc) -> None:
-        if not set(delta_state) <= {"text"}:
-            raise AssertionError(
-                f"Frontend tried to change `{type(self).__name__}` state: {delta_state}"
-            )
+        # This runs on every keystroke, so avoid building sets
+        for key in delta_state:
+            if key != "text":
+                raise AssertionError(
+                    f"Frontend tried to change `{type(self).__name__}` state: {delta_state}"
+                )
+
+            if not self.is_sensitive:
+                raise AssertionError(
+                    f"Frontend tried to set `TextInput.text` even though `is_sensitive` is `False`"
+                )
+
+    def _apply_delta_state_from_frontend(
+        self, delta_state: dict[str, Any]
+    ) -> None:
+        # The session applies the delta state before calling
+        # `_call_event_handlers_for_delta_state`, so this is the last chance to
+        # compare the new text against the old one.
+        try:
+            new_value = delta_state["text"]
+        except KeyError:
+            self._text_changed_by_frontend = False
+        else:
+            self._text_changed_by_frontend = new_value != self.text
 
-        if "text" in delta_state and not self.is_sensitive:
-            raise AssertionError(
-                f"Frontend tried to set `TextInput.text` even though `is_sensitive` is `False`"
-            )
+        super()._apply_delta_state_from_frontend(delta_state)
 
     async def _call_event_handlers_for_delta_state(
         self, delta_state: JsonDoc
@@ -170,10 +192,12 @@ class TextInput(KeyboardFocusableFundamentalComponent):
             pass
         else:
             assert isinstance(new_value, str), new_value
-            await self.call_event_handler(
-                self.on_change,
-                TextInputChangeEvent(new_value),
-            )
+
+            if self._text_changed_by_frontend:
+                await self.call_event_handler(
+                    self.on_change,
+                    TextInputChangeEvent(new_value),
+                )
 
         self._apply_delta_state_from_frontend(delta_state)
 
@@ -185,9 +209,17 @@ class TextInput(KeyboardFocusableFundamentalComponent):
         # date value.
         assert isinstance(msg, dict), msg
 
+        session = self.session
+
+        # This only updates the state. Unlike
+        # `_call_event_handlers_for_delta_state`, it doesn't trigger any
+        # events, so `on_change` is only called once, below.
         self._apply_delta_state_from_frontend({"text": msg["text"]})
 
         # Trigger both the change event...
+        #
+        # Note that `self.text` is deliberately read again for each event: The
+        # `on_change` handler may modify it, and `on_confirm` has to see that.
         await self.call_event_handler(
             self.on_change,
             TextInputChangeEvent(self.text),
@@ -200,7 +232,7 @@ class TextInput(KeyboardFocusableFundamentalComponent):
         )
 
         # Refresh the session
-        await self.session._refresh()
+        await session._refresh()
 
 
 TextInput._unique_id = "TextInput-builtin"
@@ -291,6 +291,11 @@ class Session(unicall.Unicall):
             weakref.WeakSet()
         )
 
+        # Incremented whenever the component tree may have changed, i.e. when a
+        # component is marked as dirty or components are being built. This
+        # allows caches derived from the tree to detect that they're outdated.
+        self._tree_version = 0
+
         # HTML components have source code which must be evaluated by the client
         # exactly once. Keep track of which components have already sent their
         # source code.
@@ -917,6 +922,7 @@ window.history.{method}(null, "", {json.dumps(active_page_url.path)})
         will be added after the parent is built anyway.
         """
         self._dirty_components.add(component)
+        self._tree_version += 1
 
         if not include_children_recursively or not isinstance(
             component, fundamental_component.FundamentalComponent
@@ -957,6 +963,9 @@ window.history.{method}(null, "", {json.dumps(active_page_url.path)})
         # Keep track of of previous child components
         old_children_in_build_boundary_for_visited_children = {}
 
+        # Building components changes the component tree
+        self._tree_version += 1
+
         # Build all dirty components
         while self._dirty_components:
             component = self._dirty_components.pop()
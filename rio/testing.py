@@ -1,7 +1,7 @@
 import asyncio
-from collections.abc import Callable, Iterable, Iterator, Mapping
+import collections
+from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping
 
-import ordered_set
 import starlette.datastructures
 from typing_extensions import Self, TypeVar, overload
 from uniserde import JsonDoc
@@ -87,9 +87,27 @@ class TestClient:
         self._transport = MessageRecorderTransport(
             process_sent_message=self._process_sent_message
         )
-        self._first_refresh_completed = asyncio.Event()
+
+        # Created in `__aenter__`, so that instantiating a `TestClient` doesn't
+        # require an event loop
+        self._first_refresh_completed: asyncio.Event | None = None
+
+        # The decoded state changes of the most recent `updateComponentStates`
+        # message, along with the message they were decoded from
+        self._last_component_state_changes_cache: (
+            tuple[JsonDoc, dict[rio.Component, Mapping[str, object]]] | None
+        ) = None
+
+        # All components in the component tree, grouped by their type. This is
+        # rebuilt whenever the session's component tree changes. Note that the
+        # index holds strong references, so components which have been removed
+        # from the tree are kept alive until the next rebuild.
+        self._component_index: dict[type, list[rio.Component]] | None = None
+        self._index_version = -1
 
     def _process_sent_message(self, message: JsonDoc) -> None:
+        # Requests (as opposed to notifications) expect a response. There's no
+        # actual client, so simply respond with `None`.
         if "id" in message:
             self._transport.queue_response(
                 {
@@ -99,10 +117,15 @@ class TestClient:
                 }
             )
 
-        if message["method"] == "updateComponentStates":
+        if (
+            message["method"] == "updateComponentStates"
+            and self._first_refresh_completed is not None
+        ):
             self._first_refresh_completed.set()
 
     async def __aenter__(self) -> Self:
+        self._first_refresh_completed = asyncio.Event()
+
         url = str(rio.URL("http://unit.test") / self._active_url.lstrip("/"))
 
         self._session = await self._app_server.create_session(
@@ -117,6 +140,9 @@ class TestClient:
         )
 
         if self._use_ordered_dirty_set:
+            # Only few tests need this, so avoid importing it unless necessary
+            import ordered_set
+
             self._session._dirty_components = ordered_set.OrderedSet(
                 self._session._dirty_components
             )  # type: ignore
@@ -138,25 +164,39 @@ class TestClient:
         return set(self.session._dirty_components)
 
     @property
-    def _last_updated_components(self) -> set[rio.Component]:
-        return set(self._last_component_state_changes)
+    def _last_updated_components(self) -> KeysView[rio.Component]:
+        # The state changes are cached, so there's no need to copy them into a
+        # new set
+        return self._last_component_state_changes.keys()
 
     @property
     def _last_component_state_changes(
         self,
     ) -> Mapping[rio.Component, Mapping[str, object]]:
-        for message in reversed(self._transport.sent_messages):
-            if message["method"] == "updateComponentStates":
-                delta_states: dict = message["params"]["deltaStates"]  # type: ignore
-                return {
-                    self.session._weak_components_by_id[
-                        int(component_id)
-                    ]: delta
-                    for component_id, delta in delta_states.items()
-                    if int(component_id) != self.session._root_component._id
-                }
+        message = self._transport.last_update_message
+
+        if message is None:
+            return {}
+
+        # Decoding the message is only necessary once
+        cache = self._last_component_state_changes_cache
+        if cache is not None and cache[0] is message:
+            return cache[1]
 
-        return {}
+        weak_components_by_id = self.session._weak_components_by_id
+        root_component_id = self.session._root_component._id
+
+        delta_states: dict = message["params"]["deltaStates"]  # type: ignore
+        state_changes: dict[rio.Component, Mapping[str, object]] = {}
+
+        for component_id, delta in delta_states.items():
+            component_id = int(component_id)
+
+            if component_id != root_component_id:
+                state_changes[weak_components_by_id[component_id]] = delta
+
+        self._last_component_state_changes_cache = (message, state_changes)
+        return state_changes
 
     def _get_build_output(
         self,
@@ -188,12 +228,23 @@ class TestClient:
     def root_component(self) -> rio.Component:
         return self.session._get_user_root_component()
 
-    def get_components(self, component_type: type[C]) -> Iterator[C]:
-        root_component = self.root_component
+    def _get_component_index(self) -> dict[type, list[rio.Component]]:
+        tree_version = self.session._tree_version
 
-        for component in root_component._iter_component_tree():
-            if type(component) is component_type:
-                yield component  # type: ignore
+        if self._component_index is None or self._index_version != tree_version:
+            index = collections.defaultdict[type, list[rio.Component]](list)
+
+            for component in self.root_component._iter_component_tree():
+                index[type(component)].append(component)
+
+            self._component_index = index
+            self._index_version = tree_version
+
+        return self._component_index
+
+    def get_components(self, component_type: type[C]) -> Iterator[C]:
+        components = self._get_component_index().get(component_type, [])
+        return iter(components)  # type: ignore
 
     def get_component(self, component_type: type[C]) -> C:
         try:
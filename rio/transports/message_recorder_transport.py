@@ -20,10 +20,36 @@ class MessageRecorderTransport(AbstractTransport):
         self.sent_messages = list[JsonDoc]()
         self._responses = asyncio.Queue[JsonDoc | None]()
 
+        # Position of the most recent `updateComponentStates` message in
+        # `sent_messages`
+        self._last_update_index: int | None = None
+
+    @property
+    def last_update_message(self) -> JsonDoc | None:
+        """
+        The most recently sent `updateComponentStates` message, or `None` if
+        there is none in `sent_messages`.
+        """
+        # `sent_messages` may have been cleared since the last update was sent,
+        # so make sure the remembered message is still there
+        index = self._last_update_index
+
+        if index is None or index >= len(self.sent_messages):
+            return None
+
+        message = self.sent_messages[index]
+        if message.get("method") != "updateComponentStates":
+            return None
+
+        return message
+
     async def send(self, msg: str) -> None:
         parsed_msg = json.loads(msg)
         self.sent_messages.append(parsed_msg)
 
+        if parsed_msg.get("method") == "updateComponentStates":
+            self._last_update_index = len(self.sent_messages) - 1
+
         if self.process_sent_message is not None:
             self.process_sent_message(parsed_msg)
 
@@ -90,3 +90,28 @@ async def test_refresh_after_synchronous_mount_handler():
         last_component_state_changes = test_client._last_component_state_changes
         assert switch in last_component_state_changes
         assert last_component_state_changes[switch].get("is_on") is True
+
+
+async def test_text_input_on_change_only_fires_for_new_text():
+    changes: list[str] = []
+
+    def build():
+        return rio.TextInput(
+            "hello",
+            on_change=lambda event: changes.append(event.text),
+        )
+
+    async with rio.testing.TestClient(build) as test_client:
+        text_input = test_client.get_component(rio.TextInput)
+
+        # The frontend echoing the current text isn't a change
+        await test_client.session._component_state_update(
+            text_input._id, {"text": "hello"}
+        )
+        assert changes == []
+
+        await test_client.session._component_state_update(
+            text_input._id, {"text": "world"}
+        )
+        assert changes == ["world"]
+        assert text_input.text == "world"
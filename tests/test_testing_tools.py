@@ -35,3 +35,46 @@ async def test_rebuild_resets_crashed_build_functions():
         await test_client.refresh()
 
         assert not test_client.crashed_build_functions
+
+
+async def test_get_components_after_tree_change():
+    class Toggler(rio.Component):
+        show_text: bool = False
+
+        def build(self) -> rio.Component:
+            if self.show_text:
+                return rio.Text("hi")
+            else:
+                return rio.Spacer()
+
+    async with rio.testing.TestClient(Toggler) as test_client:
+        assert not list(test_client.get_components(rio.Text))
+
+        toggler = test_client.get_component(Toggler)
+        toggler.show_text = True
+
+        await test_client.refresh()
+
+        assert len(list(test_client.get_components(rio.Text))) == 1
+        assert not list(test_client.get_components(rio.Spacer))
+
+
+async def test_get_component_returns_first_match_in_pre_order():
+    class Wrapper(rio.Component):
+        def build(self) -> rio.Component:
+            return rio.Text("second")
+
+    def build() -> rio.Component:
+        return rio.Column(
+            rio.Row(
+                rio.Text("first"),
+                Wrapper(),
+            ),
+            rio.Text("third"),
+        )
+
+    async with rio.testing.TestClient(build) as test_client:
+        assert test_client.get_component(rio.Text).text == "first"
+
+        texts = test_client.get_components(rio.Text)
+        assert [text.text for text in texts] == ["first", "second", "third"]